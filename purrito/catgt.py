@@ -4,13 +4,295 @@ CatGt wrapper with pipeline-oriented option grouping and execution support.
 This design organizes options by processing stage: input > filters > extraction > output
 """
 
+import asyncio
+import contextlib
+import hashlib
 import os
+import re
+import shlex
+import shutil
+import string
 import subprocess
-from typing import Optional, List, Dict, Any, Union
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import partial
+from typing import Optional, List, Dict, Any, Iterator, Union
 from pathlib import Path
 
 # TODO:
 
+# supercat_element={dir,run_ga} line written to first-pass FYI files
+_SUPERCAT_RE = re.compile(r'supercat_element=\{([^,]+),([^}]+)\}')
+
+# Characters kept in log file names; the rest (e.g. ':' in "0,3:5") become '-'
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w,.-]+')
+
+
+def _format_flag(name: str, value: bool) -> Optional[str]:
+    """Boolean flags are just present when True."""
+    return f"-{name}" if value else None
+
+
+def _format_sequence(name: str, value: Union[list, tuple]) -> str:
+    """List values are comma-separated."""
+    try:
+        # Lists of strings need no per-item conversion
+        joined = ",".join(value)
+    except TypeError:
+        joined = ",".join([str(item) for item in value])
+    return f"-{name}={joined}"
+
+
+def _format_value(name: str, value: Any) -> str:
+    """Regular key=value pairs."""
+    return f"-{name}={value}"
+
+
+def _format_unset(name: str, value: None) -> None:
+    """None means unset, as in `_update_options`; emit nothing."""
+    return None
+
+
+def _format_other(name: str, value: Any) -> Optional[str]:
+    """Fallback for types missing from `_FORMATTERS` (e.g. list subclasses)."""
+    if isinstance(value, (list, tuple)):
+        return _format_sequence(name, value)
+    return _format_value(name, value)
+
+
+# Option formatter keyed on the exact type of the value
+_FORMATTERS = {
+    bool: _format_flag,
+    list: _format_sequence,
+    tuple: _format_sequence,
+    int: _format_value,
+    float: _format_value,
+    str: _format_value,
+    type(None): _format_unset,
+}
+
+# CatGt options that never take a value; these format as flags whatever the
+# value type (e.g. prb_fld=1), ahead of the type-keyed lookup
+_FLAG_OPTIONS = (
+    'ap', 'lf', 'ni', 'ob',
+    'prb_fld', 'out_prb_fld', 'prb_miss_ok', 't_miss_ok', 'no_catgt_fld',
+    'gblcar', 'gbldmx',
+    'supercat_trim_edges', 'supercat_skip_ni_ob_bin',
+)
+_NAMED_FORMATTERS = dict.fromkeys(_FLAG_OPTIONS, _format_flag)
+
+
+def _format_option(name: str, value: Any) -> Optional[str]:
+    """Format one option as a command line fragment, or None to omit it."""
+    # CatGt flags keep their underscores (prb_fld, t_miss_ok, ...), so
+    # option names are passed through verbatim
+    formatter = _NAMED_FORMATTERS.get(name) or _FORMATTERS.get(type(value), _format_other)
+    return formatter(name, value)
+
+
+class _NotifyingDict(dict):
+    """Dict that reports every mutation to its owning `CatGt_wrapper`.
+
+    The owner drops its cached command on each report, so direct
+    ``catgt.options[...] = ...`` style access stays in sync with it.
+    """
+
+    __slots__ = ("_on_change",)
+
+    def __init__(self, on_change, *args, **kwargs):
+        super().__init__()
+        self._on_change = on_change
+        if args or kwargs:
+            self.update(*args, **kwargs)
+
+    def __reduce__(self):
+        # Pickle/copy as a plain dict; the owner re-wraps it on assignment
+        return (dict, (dict(self),))
+
+    def _store(self, key, value):
+        super().__setitem__(key, value)
+
+    def _forget(self, key):
+        """Drop any per-key state kept next to the dict entry."""
+
+    def __setitem__(self, key, value):
+        self._store(key, value)
+        self._on_change()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._forget(key)
+        self._on_change()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def pop(self, key, *default):
+        value = super().pop(key, *default)
+        self._forget(key)
+        self._on_change()
+        return value
+
+    def popitem(self):
+        key, value = super().popitem()
+        self._forget(key)
+        self._on_change()
+        return key, value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self._store(key, value)
+        self._on_change()
+
+    def clear(self):
+        for key in list(self):
+            self._forget(key)
+        super().clear()
+        self._on_change()
+
+
+class _Options(_NotifyingDict):
+    """Options dict that keeps formatted fragments and reports mutations.
+
+    Each option's command line fragment is formatted when the option is
+    set, so building a command only collects the stored fragments. List
+    values are stored as tuples, so the value and its fragment can't drift
+    apart through in-place edits of the caller's list.
+    """
+
+    __slots__ = ("_fragments",)
+
+    def __init__(self, on_change, *args, **kwargs):
+        self._fragments: Dict[str, Optional[str]] = {}
+        super().__init__(on_change, *args, **kwargs)
+
+    def _store(self, key, value):
+        if isinstance(value, list):
+            value = tuple(value)
+        super()._store(key, value)
+        self._fragments[key] = _format_option(key, value)
+
+    def _forget(self, key):
+        self._fragments.pop(key, None)
+
+    def fragments(self) -> List[str]:
+        """Return the formatted fragments of all options, in insertion order."""
+        return [fragment for fragment in self._fragments.values() if fragment is not None]
+
+
+class _Extraction(_NotifyingDict):
+    """Extraction dict (xa, xd, xia, xid) that stores patterns as tuples.
+
+    A single pattern string becomes a one-item tuple. Tuples can't be
+    edited in place, so every change goes through ``__setitem__`` and
+    reaches the owner's cached command.
+    """
+
+    __slots__ = ()
+
+    def _store(self, key, value):
+        super()._store(key, (value,) if isinstance(value, str) else tuple(value))
+
+
+async def _run_one(
+    wrapper: 'CatGt_wrapper', semaphore: asyncio.Semaphore, fast_spawn: bool
+) -> subprocess.CompletedProcess:
+    """Run a single wrapper's command once a semaphore slot is free."""
+    args = wrapper.get_command_args()
+    async with semaphore:
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            **wrapper._spawn_kwargs(fast_spawn),
+        )
+        stdout, stderr = await proc.communicate()
+    return subprocess.CompletedProcess(args, proc.returncode, stdout, stderr)
+
+
+async def _run_all(
+    wrappers: List['CatGt_wrapper'], max_parallel: int, fast_spawn: bool = False
+) -> List[subprocess.CompletedProcess]:
+    """Run all wrappers with at most `max_parallel` processes in flight."""
+    semaphore = asyncio.Semaphore(max_parallel)
+    return await asyncio.gather(
+        *(_run_one(w, semaphore, fast_spawn) for w in wrappers)
+    )
+
+
+def _absolute_path(path: str) -> str:
+    """Make `path` absolute against the current cwd and normalize it."""
+    # normpath gives the same result as abspath for absolute paths without
+    # the getcwd() call
+    return os.path.normpath(path) if os.path.isabs(path) else os.path.abspath(path)
+
+
+# Resolved absolute paths of CatGt executables, keyed by the configured path
+# and the PATH it was looked up on. Only successful lookups are kept, so a
+# later install is still picked up.
+_RESOLVED_EXECUTABLES: Dict[tuple, str] = {}
+
+
+def _resolve_executable(
+    path: str, env: Optional[Dict[str, str]] = None, cwd: Optional[str] = None
+) -> Optional[str]:
+    """Resolve a CatGt executable to an absolute path, or None if not runnable.
+
+    The lookup matches what a child started with `env` and `cwd` would run:
+    bare names are searched on the PATH of `env` (the current PATH if None)
+    and relative paths are taken from `cwd`.
+    """
+    search_dirs = os.get_exec_path(env)
+    if cwd is not None:
+        # The child resolves relative PATH entries after changing directory
+        search_dirs = [os.path.join(cwd, folder) for folder in search_dirs]
+    search_path = os.pathsep.join(search_dirs)
+    key = (path, search_path)
+    resolved = _RESOLVED_EXECUTABLES.get(key)
+    if resolved is None:
+        candidate = path
+        if cwd is not None and os.path.dirname(path):
+            candidate = os.path.join(cwd, path)
+        # which() checks PATH for bare names and existence/X_OK for paths
+        found = shutil.which(candidate, path=search_path)
+        if found is None:
+            return None
+        resolved = os.path.abspath(found)
+        # Relative paths like ./CatGt or a relative PATH entry depend on
+        # the cwd, so only lookups that were already absolute are cached
+        if os.path.isabs(found) and (os.path.isabs(path) or not os.path.dirname(path)):
+            _RESOLVED_EXECUTABLES[key] = resolved
+    return resolved
+
+
+def _require_executables(
+    paths, env: Optional[Dict[str, str]] = None, cwd: Optional[str] = None
+) -> None:
+    """Raise FileNotFoundError for the first CatGt path that cannot be run.
+
+    `env` and `cwd` are those the jobs will be started with; see
+    `_resolve_executable`.
+    """
+    for path in dict.fromkeys(paths):
+        if _resolve_executable(path, env, cwd) is None:
+            raise FileNotFoundError(
+                f"CatGt executable not found at: {path}\n"
+                f"Please verify the path is correct."
+            )
+
+
+def _run_config(
+    config: Dict[str, Any], run_kwargs: Dict[str, Any]
+) -> subprocess.CompletedProcess:
+    """Rebuild a wrapper from `to_dict()` output and run it (picklable for workers)."""
+    return CatGt_wrapper.from_dict(config).run(**run_kwargs)
+
+
 class CatGt_wrapper:
     """
     A Python wrapper class for CatGt command-line tool with pipeline-oriented option setting.
@@ -29,6 +311,11 @@ class CatGt_wrapper:
         Trigger index
     prb_fld : bool, optional
             Whether the probe data is organized in folders
+    validate : bool, default=False
+        If True, check now that `catgt_path` is an executable (on PATH or
+        as a path) and store its resolved absolute path; raises
+        FileNotFoundError otherwise. By default the path is only checked
+        when the command is run.
         
     Examples
     --------
@@ -43,6 +330,20 @@ class CatGt_wrapper:
     >>> catgt.set_filters(ap=True, lf=True, loccar=2)
     >>> result = catgt.run()
     """
+
+    __slots__ = (
+        "catgt_path",
+        "_basepath",
+        "_basepath_abs",
+        "_run_name",
+        "gate",
+        "trigger",
+        "prb_fld",
+        "options",
+        "extraction",
+        "_args_cache",
+        "_base_args",
+    )
     
     def __init__(
         self,
@@ -52,6 +353,7 @@ class CatGt_wrapper:
         gate: Optional[int] = 0,
         trigger: Optional[int] = 0,
         prb_fld: Optional[bool] = None,
+        validate: bool = False,
         **kwargs
     ):
         """Initialize CatGt wrapper with executable path and run info.
@@ -63,22 +365,65 @@ class CatGt_wrapper:
             raise ValueError("catgt_path cannot be empty")
         if not basepath:
             raise ValueError("basepath cannot be empty")
+        if validate:
+            _require_executables([catgt_path])
+            catgt_path = _resolve_executable(catgt_path)
         
-        # if run_name was not provided, estimate ast the name of the basepath folder (removing _g0 etc)
-        if run_name is None:
-            run_name = os.path.basename(os.path.normpath(basepath)).split("_g0")[0]
-
-        self.catgt_path = catgt_path
-        self.basepath = os.path.abspath(basepath)
-        self.run_name = run_name
-        self.gate = gate
-        self.trigger = trigger
-        self.prb_fld = prb_fld
-        self.options: Dict[str, Any] = {}
+        # Nothing is cached yet, so the initial state skips the invalidating
+        # __setattr__ hook; run_name is estimated on first access
+        init = object.__setattr__
+        init(self, '_args_cache', None)
+        init(self, '_base_args', None)
+        init(self, 'catgt_path', catgt_path)
+        init(self, '_basepath', basepath)
+        init(self, '_basepath_abs', _absolute_path(basepath))
+        init(self, '_run_name', run_name)
+        init(self, 'gate', gate)
+        init(self, 'trigger', trigger)
+        init(self, 'prb_fld', prb_fld)
+        init(self, 'options', _Options(self._invalidate_command))
 
         # Accept older-style options passed in constructor (e.g., ap=True, prb=0)
         if kwargs:
             self._update_options(kwargs)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, dropping the cached command if it is public state."""
+        if name == 'options':
+            value = _Options(self._invalidate_command, value)
+        elif name == 'extraction':
+            value = _Extraction(self._invalidate_command, value)
+        object.__setattr__(self, name, value)
+        if not name.startswith('_'):
+            if name not in ('options', 'extraction'):
+                # catgt_path, basepath, run_name, gate or trigger changed
+                object.__setattr__(self, '_base_args', None)
+            self._invalidate_command()
+
+    def _invalidate_command(self) -> None:
+        """Drop the cached command so the next build reflects current state."""
+        object.__setattr__(self, '_args_cache', None)
+
+    @property
+    def basepath(self) -> str:
+        """Absolute, normalized base directory path."""
+        return self._basepath_abs
+
+    @basepath.setter
+    def basepath(self, value: str) -> None:
+        self._basepath = value
+        self._basepath_abs = _absolute_path(value)
+
+    @property
+    def run_name(self) -> str:
+        """Run name; if not given, the basepath folder name (removing _g0 etc)."""
+        if self._run_name is None:
+            return os.path.basename(os.path.normpath(self._basepath)).split("_g0")[0]
+        return self._run_name
+
+    @run_name.setter
+    def run_name(self, value: Optional[str]) -> None:
+        self._run_name = value
         
     def set_input(
         self,
@@ -268,6 +613,9 @@ class CatGt_wrapper:
     ) -> 'CatGt_wrapper':
         """
         Set extraction options.
+
+        Patterns are kept in `extraction` as tuples; to change them later,
+        assign a new entry (``catgt.extraction['xd'] = [...]``).
         
         Parameters
         ----------
@@ -294,21 +642,21 @@ class CatGt_wrapper:
         if not hasattr(self, 'extraction'):
             self.extraction = {}
         
-        # Handle xa - normalize to list
+        # Handle xa - normalized to a tuple by the extraction dict
         if xa is not None:
-            self.extraction['xa'] = [xa] if isinstance(xa, str) else list(xa)
+            self.extraction['xa'] = xa
         
-        # Handle xd - normalize to list
+        # Handle xd - normalized to a tuple by the extraction dict
         if xd is not None:
-            self.extraction['xd'] = [xd] if isinstance(xd, str) else list(xd)
+            self.extraction['xd'] = xd
         
-        # Handle xia - normalize to list
+        # Handle xia - normalized to a tuple by the extraction dict
         if xia is not None:
-            self.extraction['xia'] = [xia] if isinstance(xia, str) else list(xia)
+            self.extraction['xia'] = xia
         
-        # Handle xid - normalize to list
+        # Handle xid - normalized to a tuple by the extraction dict
         if xid is not None:
-            self.extraction['xid'] = [xid] if isinstance(xid, str) else list(xid)
+            self.extraction['xid'] = xid
         
         # Handle additional kwargs
         self._update_options(kwargs)
@@ -360,7 +708,7 @@ class CatGt_wrapper:
         Parameters
         ----------
         key : str
-            Option name (underscores will be converted to dashes)
+            Option name as CatGt spells it (e.g. "t_miss_ok")
         value : Any
             Option value
             
@@ -497,16 +845,21 @@ class CatGt_wrapper:
         if not dest:
             raise ValueError("dest parameter is required for supercat operations")
 
-        # Validate each run entry
+        # Validate each run entry and build the supercat string
+        # {dir,run_ga}{dir,run_ga}... in a single pass
+        parts = []
+        append = parts.append
         for i, run in enumerate(runs):
             if not isinstance(run, dict):
                 raise ValueError(f"Run entry {i} must be a dictionary")
             if 'dir' not in run or 'run_ga' not in run:
                 raise ValueError(f"Run entry {i} must contain 'dir' and 'run_ga' keys")
-
-        # Build the supercat string: {dir,run_ga}{dir,run_ga}...
-        supercat_elements = [f"{{{run['dir']},{run['run_ga']}}}" for run in runs]
-        supercat_str = ''.join(supercat_elements)
+            append('{')
+            append(str(run['dir']))
+            append(',')
+            append(str(run['run_ga']))
+            append('}')
+        supercat_str = ''.join(parts)
 
         params = {
             'supercat': supercat_str,
@@ -527,25 +880,8 @@ class CatGt_wrapper:
     
     def _format_options(self) -> List[str]:
         """Format additional options as command line arguments."""
-        formatted = []
-        
-        for key, value in self.options.items():
-            # Convert Python naming convention to CatGt naming
-            # option_name = key.replace("_", "-")
-            option_name = key
-            
-            if isinstance(value, bool):
-                if value:
-                    # Boolean flags are just present when True
-                    formatted.append(f"-{option_name}")
-            elif isinstance(value, (list, tuple)):
-                # List values are comma-separated
-                formatted.append(f"-{option_name}={','.join(map(str, value))}")
-            else:
-                # Regular key=value pairs
-                formatted.append(f"-{option_name}={value}")
-                
-        return formatted
+        # Fragments are formatted when options are set; see `_Options`
+        return self.options.fragments()
     
     def get_command_args(self) -> List[str]:
         """
@@ -561,15 +897,42 @@ class CatGt_wrapper:
         >>> catgt = CatGt("/usr/local/bin/CatGt", "/data", "g0", gate=0)
         >>> catgt.set_filters(ap=True)
         >>> args = catgt.get_command_args()
+
+        Notes
+        -----
+        The list is cached until an option or base field changes, so the
+        repeated calls made by `run()`, `dry_run()`, `__str__` and friends
+        are cheap. A copy is returned so callers may modify it freely.
         """
-        args = [self.catgt_path]
-        args.append(f"-dir={self.basepath}")
-        args.append(f"-run={self.run_name}")
-        
-        if self.gate is not None:
-            args.append(f"-g={self.gate}")
-        if self.trigger is not None:
-            args.append(f"-t={self.trigger}")
+        return list(self._iter_args())
+
+    def _iter_args(self) -> Iterator[str]:
+        """Iterate over the cached command and arguments without copying them.
+
+        For read-only consumers such as `__str__`. Anything that may keep or
+        modify the list (subprocess stores it as ``args``) should use
+        `get_command_args()` instead.
+        """
+        if self._args_cache is None:
+            self._args_cache = self._build_args()
+        return iter(self._args_cache)
+
+    def _build_args(self) -> List[str]:
+        """Build the command and arguments list from the current state."""
+        # The executable/-dir/-run/-g/-t fragments only change when a base
+        # field is assigned, so they survive option edits
+        if self._base_args is None:
+            base_args = [self.catgt_path]
+            base_args.append(f"-dir={self.basepath}")
+            base_args.append(f"-run={self.run_name}")
+            
+            if self.gate is not None:
+                base_args.append(f"-g={self.gate}")
+            if self.trigger is not None:
+                base_args.append(f"-t={self.trigger}")
+            self._base_args = base_args
+
+        args = list(self._base_args)
 
         # Handle extraction options (xa, xd, xia, xid) - each list item becomes separate arg
         if hasattr(self, 'extraction'):
@@ -587,6 +950,10 @@ class CatGt_wrapper:
         check: bool = True,
         capture_output: bool = True,
         timeout: Optional[float] = None,
+        stdout_path: Optional[str] = None,
+        stderr_path: Optional[str] = None,
+        log_dir: Optional[str] = None,
+        fast_spawn: bool = False,
         **subprocess_kwargs
     ) -> subprocess.CompletedProcess:
         """
@@ -597,21 +964,47 @@ class CatGt_wrapper:
         check : bool, default=True
             If True, raise CalledProcessError if command returns non-zero exit status
         capture_output : bool, default=True
-            If True, capture stdout and stderr
+            If True, capture stdout and stderr in memory. CatGt is verbose on
+            long recordings, so this can hold several MB per run; prefer
+            `stdout_path`/`stderr_path` when running many jobs.
         timeout : float, optional
             Timeout in seconds for the command execution
+        stdout_path : str, optional
+            File to stream stdout to instead of capturing it in memory
+        stderr_path : str, optional
+            File to stream stderr to instead of capturing it in memory. May
+            be the same file as `stdout_path` for one combined log
+        log_dir : str, optional
+            Directory to stream both outputs to, as
+            ``<run_name>_g<gate>_t<trigger>[_imec<prb>]_<hash>_catgt.out``
+            and ``.err`` (created if missing), where ``<hash>`` is the
+            start of `argv_fingerprint`. Explicit `stdout_path`/`stderr_path` take
+            precedence. Useful with `run_batch`, where every job then
+            writes its own files.
+        fast_spawn : bool, default=False
+            If True, launch with close_fds=False and the resolved absolute
+            executable path (left out when `env` or `cwd` is given, so the
+            same program runs either way), so the child does not have to walk and close
+            every inherited file descriptor. Together these let CPython use
+            posix_spawn instead of fork+exec, which is faster when the parent
+            holds many open files or a large heap (e.g. a notebook). The
+            child then inherits the parent's inheritable file descriptors.
         **subprocess_kwargs
             Additional keyword arguments passed to subprocess.run()
             
         Returns
         -------
         subprocess.CompletedProcess
-            The result of the subprocess execution with returncode, stdout, stderr
+            The result of the subprocess execution with returncode, stdout, stderr.
+            stdout/stderr are None for streams written to a file, whose
+            paths are set as `stdout_path`/`stderr_path` attributes.
             
         Raises
         ------
         subprocess.CalledProcessError
-            If check=True and the command returns non-zero exit status
+            If check=True and the command returns non-zero exit status. Its
+            `stdout_path`/`stderr_path` attributes give the log files (None
+            for streams that were not written to a file)
         subprocess.TimeoutExpired
             If timeout is specified and exceeded
         FileNotFoundError
@@ -631,35 +1024,135 @@ class CatGt_wrapper:
         
         Without output capture (for large outputs):
         >>> result = catgt.run(capture_output=False)
+
+        Streaming logs to disk:
+        >>> result = catgt.run(stdout_path="catgt.log", stderr_path="catgt.err")
+        >>> result = catgt.run(log_dir="/data/processed/logs")
+        >>> print(result.stdout_path)
         """
         args = self.get_command_args()
-        
-        try:
-            result = subprocess.run(
-                args,
-                check=check,
-                capture_output=capture_output,
-                timeout=timeout,
-                **subprocess_kwargs
-            )
-            return result
-            
-        except subprocess.CalledProcessError as e:
-            error_msg = f"CatGt command failed with exit code {e.returncode}"
-            if e.stderr:
-                error_msg += f"\nStderr: {e.stderr.decode()}"
-            raise subprocess.CalledProcessError(
-                e.returncode, e.cmd, e.output, e.stderr
-            ) from e
-            
-        except FileNotFoundError:
-            raise FileNotFoundError(
-                f"CatGt executable not found at: {self.catgt_path}\n"
-                f"Please verify the path is correct."
-            )
+        if log_dir is not None:
+            os.makedirs(log_dir, exist_ok=True)
+            stem = os.path.join(log_dir, self._log_stem())
+            if stdout_path is None:
+                stdout_path = stem + "_catgt.out"
+            if stderr_path is None:
+                stderr_path = stem + "_catgt.err"
+        for key, value in self._spawn_kwargs(fast_spawn, subprocess_kwargs).items():
+            subprocess_kwargs.setdefault(key, value)
+
+        with contextlib.ExitStack() as logs:
+            if stdout_path is not None or stderr_path is not None:
+                # Let the child write straight to the log files; a stream
+                # without a path keeps the capture_output behaviour
+                pipe = subprocess.PIPE if capture_output else None
+                subprocess_kwargs['stdout'] = (
+                    logs.enter_context(open(stdout_path, 'wb', buffering=1 << 20))
+                    if stdout_path is not None else pipe
+                )
+                if (
+                    stderr_path is not None and stdout_path is not None
+                    and os.path.abspath(stderr_path) == os.path.abspath(stdout_path)
+                ):
+                    # One combined log; two handles would overwrite each other
+                    subprocess_kwargs['stderr'] = subprocess.STDOUT
+                else:
+                    subprocess_kwargs['stderr'] = (
+                        logs.enter_context(open(stderr_path, 'wb', buffering=1 << 20))
+                        if stderr_path is not None else pipe
+                    )
+                capture_output = False
+
+            try:
+                result = subprocess.run(
+                    args,
+                    check=check,
+                    capture_output=capture_output,
+                    timeout=timeout,
+                    **subprocess_kwargs
+                )
+                if stdout_path is not None:
+                    result.stdout_path = stdout_path
+                if stderr_path is not None:
+                    result.stderr_path = stderr_path
+                return result
+                
+            except subprocess.CalledProcessError as e:
+                error_msg = f"CatGt command failed with exit code {e.returncode}"
+                if e.stderr:
+                    error_msg += f"\nStderr: {e.stderr.decode()}"
+                error = subprocess.CalledProcessError(
+                    e.returncode, e.cmd, e.output, e.stderr
+                )
+                # Output streamed to files isn't on the error; say where it is
+                error.stdout_path = stdout_path
+                error.stderr_path = stderr_path
+                raise error from e
+                
+            except FileNotFoundError:
+                raise FileNotFoundError(
+                    f"CatGt executable not found at: {self.catgt_path}\n"
+                    f"Please verify the path is correct."
+                )
     
+    def argv_fingerprint(self) -> str:
+        """
+        Return a stable hash of the command arguments.
+        
+        Two wrappers with the same fingerprint run exactly the same
+        command; `run_batch` uses this to skip duplicate jobs.
+        
+        Returns
+        -------
+        str
+            32-character hex digest (BLAKE2b; not meant for security use)
+        """
+        argv = "\x00".join(self._iter_args()).encode()
+        return hashlib.blake2b(argv, digest_size=16).hexdigest()
+
+    def _spawn_kwargs(
+        self, fast_spawn: bool, subprocess_kwargs: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Popen arguments that let CPython launch CatGt via posix_spawn.
+
+        CPython only takes its posix_spawn path when close_fds is False and
+        the executable is given with a directory, so a bare "CatGt" found
+        on PATH is passed as its resolved absolute path (argv is unchanged).
+        With an `env` or `cwd` in `subprocess_kwargs` the child may find a
+        different program, so no executable is passed then.
+        """
+        if not fast_spawn:
+            return {}
+        spawn_kwargs: Dict[str, Any] = {'close_fds': False}
+        if subprocess_kwargs and ('env' in subprocess_kwargs or 'cwd' in subprocess_kwargs):
+            return spawn_kwargs
+        resolved = _resolve_executable(self.catgt_path)
+        if resolved is not None:
+            spawn_kwargs['executable'] = resolved
+        return spawn_kwargs
+
+    def _log_stem(self) -> str:
+        """Name log files after the job they belong to.
+
+        The run, gate, trigger and probe keep the names readable; the
+        leading digits of `argv_fingerprint` keep them unique, so jobs
+        that only differ by options or basepath don't share a file.
+        """
+        stem = str(self.run_name)
+        if self.gate is not None:
+            stem += f"_g{self.gate}"
+        if self.trigger is not None:
+            stem += f"_t{self.trigger}"
+        prb = self.options.get('prb')
+        if prb is not None:
+            if isinstance(prb, (list, tuple)):
+                prb = ",".join([str(item) for item in prb])
+            stem += "_imec" + _UNSAFE_FILENAME_RE.sub("-", str(prb))
+        return f"{stem}_{self.argv_fingerprint()[:8]}"
+
     def run_async(
         self,
+        fast_spawn: bool = False,
         **subprocess_kwargs
     ) -> subprocess.Popen:
         """
@@ -670,6 +1163,8 @@ class CatGt_wrapper:
         
         Parameters
         ----------
+        fast_spawn : bool, default=False
+            If True, launch in posix_spawn-friendly mode; see `run()`
         **subprocess_kwargs
             Keyword arguments passed to subprocess.Popen()
             
@@ -695,7 +1190,72 @@ class CatGt_wrapper:
         >>> stdout, stderr = process.communicate()
         """
         args = self.get_command_args()
+        for key, value in self._spawn_kwargs(fast_spawn, subprocess_kwargs).items():
+            subprocess_kwargs.setdefault(key, value)
         return subprocess.Popen(args, **subprocess_kwargs)
+
+    @staticmethod
+    def run_many(
+        wrappers: List['CatGt_wrapper'],
+        max_parallel: int = 4,
+        check: bool = True,
+        fast_spawn: bool = False,
+    ) -> List[subprocess.CompletedProcess]:
+        """
+        Execute several independent CatGt commands, overlapping their runs.
+        
+        At most `max_parallel` CatGt processes run at the same time; the
+        rest wait for a free slot. stdout and stderr are captured for
+        every job.
+        
+        Parameters
+        ----------
+        wrappers : List[CatGt_wrapper]
+            Configured wrappers to execute
+        max_parallel : int, default=4
+            Maximum number of CatGt processes running concurrently
+        check : bool, default=True
+            If True, raise CalledProcessError for the first job (in input
+            order) that returned a non-zero exit status, once all jobs
+            have finished
+        fast_spawn : bool, default=False
+            If True, launch each job in posix_spawn-friendly mode; see `run()`
+            
+        Returns
+        -------
+        List[subprocess.CompletedProcess]
+            One result per wrapper, in the same order as `wrappers`
+            
+        Raises
+        ------
+        ValueError
+            If max_parallel is smaller than 1
+        FileNotFoundError
+            If a CatGt executable is not found; checked before any job starts
+        subprocess.CalledProcessError
+            If check=True and any command returns non-zero exit status
+            
+        Notes
+        -----
+        This starts its own asyncio event loop, so it cannot be called
+        from code that is already running inside one (e.g. a coroutine).
+            
+        Examples
+        --------
+        >>> catgt.set_filters(ap=True, loccar=2)
+        >>> runs = [catgt.clone(basepath=p) for p in ["/data/run1_g0", "/data/run2_g0"]]
+        >>> results = CatGt_wrapper.run_many(runs, max_parallel=2)
+        """
+        if max_parallel < 1:
+            raise ValueError("max_parallel must be at least 1")
+
+        # Fail fast on a bad executable instead of once per job
+        _require_executables(w.catgt_path for w in wrappers)
+        results = asyncio.run(_run_all(wrappers, max_parallel, fast_spawn))
+        if check:
+            for result in results:
+                result.check_returncode()
+        return results
     
     def dry_run(self) -> str:
         """
@@ -706,7 +1266,8 @@ class CatGt_wrapper:
         Returns
         -------
         str
-            The command string that would be executed
+            The command string that would be executed, as `str` gives it:
+            arguments joined with single spaces, without shell quoting
             
         Examples
         --------
@@ -715,9 +1276,7 @@ class CatGt_wrapper:
         >>> print(catgt.dry_run())
         /usr/local/bin/CatGt -dir=/data -run=g0 -g=0 -ap -loccar=2
         """
-        # build_command now returns a list suitable for subprocess; join for display
-        cmd_list = self.build_command()
-        cmd_str = " ".join(cmd_list)
+        cmd_str = str(self)
         print(f"Would execute: {cmd_str}")
         return cmd_str
     
@@ -819,19 +1378,278 @@ class CatGt_wrapper:
         return {
             'catgt_path': self.catgt_path,
             'basepath': self.basepath,
-            'run': self.run,
+            'run_name': self.run_name,
             'gate': self.gate,
             'trigger': self.trigger,
-            'options': self.options.copy()
+            'prb_fld': self.prb_fld,
+            'options': self.options.copy(),
+            'extraction': {
+                key: list(items)
+                for key, items in getattr(self, 'extraction', {}).items()
+            },
         }
+
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> 'CatGt_wrapper':
+        """
+        Create a wrapper from a configuration dictionary.
+        
+        Parameters
+        ----------
+        config : dict
+            Configuration as returned by `to_dict()`
+            
+        Returns
+        -------
+        CatGt_wrapper
+            New instance with the same command as the exported one
+        """
+        new_catgt = cls(
+            catgt_path=config['catgt_path'],
+            basepath=config['basepath'],
+            run_name=config.get('run_name'),
+            gate=config.get('gate', 0),
+            trigger=config.get('trigger', 0),
+            prb_fld=config.get('prb_fld'),
+        )
+        new_catgt.options.update(config.get('options', {}))
+        if config.get('extraction'):
+            new_catgt.set_extraction(**config['extraction'])
+        return new_catgt
+
+    @classmethod
+    def run_batch(
+        cls,
+        configs: List[Union[Dict[str, Any], 'CatGt_wrapper']],
+        n_workers: Optional[int] = None,
+        backend: str = "process",
+        client: Any = None,
+        **run_kwargs
+    ) -> List[subprocess.CompletedProcess]:
+        """
+        Execute many independent CatGt commands in parallel.
+        
+        Each configuration is rebuilt in a worker with `from_dict()` and
+        executed with `run()`, so independent runs/probes use all
+        available cores.
+        
+        Parameters
+        ----------
+        configs : list of dict or CatGt_wrapper
+            Configurations from `to_dict()`, or wrappers (exported with
+            `to_dict()` before dispatch)
+        n_workers : int, optional
+            Number of worker processes (default: number of CPUs)
+        backend : {"process", "dask"}, default="process"
+            "process" uses concurrent.futures.ProcessPoolExecutor. "dask"
+            uses a dask.distributed client (requires the `distributed`
+            package)
+        client : distributed.Client, optional
+            Existing dask client for backend="dask". If None, a local
+            cluster with `n_workers` workers is started and closed afterwards
+        **run_kwargs
+            Keyword arguments passed to `run()` for every job
+            
+        Returns
+        -------
+        List[subprocess.CompletedProcess]
+            One result per configuration, in the same order as `configs`.
+            Configurations with identical commands (see `argv_fingerprint`)
+            are run once and share the same result object.
+            
+        Raises
+        ------
+        ValueError
+            If backend is not "process" or "dask"
+        ImportError
+            If backend="dask", no `client` is given and `distributed` is not
+            installed
+        FileNotFoundError
+            If a CatGt executable is not found; checked before any job starts,
+            using the `env` and `cwd` from `run_kwargs`. Skipped when an existing dask `client` is given, since its workers
+            may not share this machine's paths
+            
+        Examples
+        --------
+        >>> configs = [catgt.clone(basepath=p).to_dict() for p in basepaths]
+        >>> results = CatGt_wrapper.run_batch(configs, n_workers=4, log_dir="/data/logs")
+        """
+        wrappers = [
+            c if isinstance(c, CatGt_wrapper) else cls.from_dict(c) for c in configs
+        ]
+        # Fail fast on a bad executable instead of once per job. An existing
+        # dask client may run jobs on other machines, so local paths can't
+        # be checked for it
+        if not (backend == "dask" and client is not None):
+            _require_executables(
+                (w.catgt_path for w in wrappers),
+                run_kwargs.get('env'),
+                run_kwargs.get('cwd'),
+            )
+
+        # Identical commands run once; duplicates share the same result
+        fingerprints = [w.argv_fingerprint() for w in wrappers]
+        unique = {}
+        for fingerprint, wrapper in zip(fingerprints, wrappers):
+            unique.setdefault(fingerprint, wrapper)
+        unique_configs = [w.to_dict() for w in unique.values()]
+        run_one = partial(_run_config, run_kwargs=run_kwargs)
+
+        if backend == "process":
+            with ProcessPoolExecutor(max_workers=n_workers) as ex:
+                results = list(ex.map(run_one, unique_configs))
+        elif backend == "dask":
+            own_client = client is None
+            if own_client:
+                try:
+                    from distributed import Client
+                except ImportError as e:
+                    raise ImportError(
+                        "backend='dask' requires the 'distributed' package"
+                    ) from e
+                client = Client(n_workers=n_workers)
+            try:
+                # Duplicates are already removed; pure=False keeps dask from
+                # caching results across calls
+                futures = client.map(run_one, unique_configs, pure=False)
+                results = client.gather(futures)
+            finally:
+                if own_client:
+                    client.close()
+        else:
+            raise ValueError(f"Unknown backend: {backend!r} (expected 'process' or 'dask')")
+
+        by_fingerprint = dict(zip(unique, results))
+        return [by_fingerprint[fingerprint] for fingerprint in fingerprints]
+
+    @classmethod
+    def run_pipeline(
+        cls,
+        configs: List[Union[Dict[str, Any], 'CatGt_wrapper']],
+        max_concurrent: Optional[int] = None,
+        **run_kwargs
+    ) -> Iterator[subprocess.CompletedProcess]:
+        """
+        Execute many CatGt commands and yield each result as it finishes.
+        
+        Up to `max_concurrent` CatGt processes are kept in flight; a new
+        one starts as soon as another finishes.
+        
+        Parameters
+        ----------
+        configs : list of dict or CatGt_wrapper
+            Configurations from `to_dict()`, or wrappers
+        max_concurrent : int, optional
+            Maximum number of CatGt processes running at the same time
+            (default: number of CPUs)
+        **run_kwargs
+            Keyword arguments passed to `run()` for every job
+            
+        Yields
+        ------
+        subprocess.CompletedProcess
+            Results in completion order; `result.args` identifies the job
+            
+        Notes
+        -----
+        The CatGt executables are checked before any job starts (with the
+        `env` and `cwd` from `run_kwargs`), raising FileNotFoundError if one
+        is missing. If a job raises (e.g.
+        CalledProcessError with check=True), the error is raised when that
+        result is reached. Jobs that have not started yet are cancelled
+        when the generator is closed early.
+            
+        Examples
+        --------
+        >>> for result in CatGt_wrapper.run_pipeline(configs, max_concurrent=4, check=False):
+        ...     print(result.args[1], result.returncode)
+        """
+        if max_concurrent is None:
+            max_concurrent = os.cpu_count() or 1
+        configs = [
+            c.to_dict() if isinstance(c, CatGt_wrapper) else c for c in configs
+        ]
+        # Fail fast on a bad executable instead of once per job
+        _require_executables(
+            (c['catgt_path'] for c in configs),
+            run_kwargs.get('env'),
+            run_kwargs.get('cwd'),
+        )
+        if not configs:
+            return
+
+        # Threads only wait on the CatGt processes, so the GIL is not a limit
+        with ThreadPoolExecutor(max_workers=max_concurrent) as ex:
+            futures = [ex.submit(_run_config, cfg, run_kwargs) for cfg in configs]
+            try:
+                for future in as_completed(futures):
+                    yield future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    @classmethod
+    def run_batch_slurm(
+        cls,
+        configs: List[Union[Dict[str, Any], 'CatGt_wrapper']],
+        script_template: str,
+        script_dir: str,
+        submit: bool = False,
+    ) -> List[str]:
+        """
+        Write one SLURM batch script per configuration for HPC clusters.
+        
+        Parameters
+        ----------
+        configs : list of dict or CatGt_wrapper
+            Configurations from `to_dict()`, or wrappers
+        script_template : str
+            sbatch script text. ``$command`` is replaced by the shell-quoted
+            CatGt command, ``$run_name`` by the run name and ``$index`` by
+            the position in `configs`; other ``$VARS`` are left untouched
+        script_dir : str
+            Directory the scripts are written to (created if missing)
+        submit : bool, default=False
+            If True, submit each script with ``sbatch``
+            
+        Returns
+        -------
+        List[str]
+            Paths of the written scripts, in the same order as `configs`
+            
+        Examples
+        --------
+        >>> template = "#!/bin/bash\n#SBATCH --job-name=catgt_$run_name\n$command\n"
+        >>> CatGt_wrapper.run_batch_slurm(configs, template, "/scratch/catgt_jobs")
+        """
+        template = string.Template(script_template)
+        os.makedirs(script_dir, exist_ok=True)
+
+        script_paths = []
+        for i, config in enumerate(configs):
+            wrapper = config if isinstance(config, CatGt_wrapper) else cls.from_dict(config)
+            script_path = os.path.join(script_dir, f"catgt_{i:04d}_{wrapper.run_name}.sh")
+            with open(script_path, 'w') as f:
+                f.write(template.safe_substitute(
+                    command=shlex.join(wrapper.get_command_args()),
+                    run_name=wrapper.run_name,
+                    index=i,
+                ))
+            script_paths.append(script_path)
+
+        if submit:
+            for script_path in script_paths:
+                subprocess.run(['sbatch', script_path], check=True)
+        return script_paths
     
     def __str__(self) -> str:
         """Return the command string when converting to string.
 
         Since `build_command` returns a list (for subprocess), join it for
-        human-readable output.
+        human-readable output. Arguments are joined with single spaces and
+        not quoted; use `build_command` to run the command.
         """
-        return " ".join(self.build_command())
+        return " ".join(self._iter_args())
     
     @staticmethod
     def parse_fyi_supercat_element(fyi_path: str) -> Dict[str, str]:
@@ -854,16 +1672,16 @@ class CatGt_wrapper:
         >>> runs = [element]
         >>> catgt.set_supercat(runs, dest="/data/output")
         """
-        import re
-        
         if not os.path.exists(fyi_path):
             raise FileNotFoundError(f"FYI file not found: {fyi_path}")
         
-        with open(fyi_path, 'r') as f:
-            content = f.read()
-        
-        # Look for the supercat_element line
-        match = re.search(r'supercat_element=\{([^,]+),([^}]+)\}', content)
+        # Look for the supercat_element line, stopping at the first match
+        match = None
+        with open(fyi_path, 'r', buffering=1 << 16) as f:
+            for line in f:
+                match = _SUPERCAT_RE.search(line)
+                if match:
+                    break
         if not match:
             raise ValueError(f"No supercat_element found in {fyi_path}")
         
@@ -885,7 +1703,14 @@ class CatGt_wrapper:
         Returns
         -------
         List[Dict[str, str]]
-            List of run dictionaries suitable for set_supercat()
+            List of run dictionaries suitable for set_supercat(), in the
+            same order as `fyi_paths`
+
+        Notes
+        -----
+        Files are parsed concurrently on a thread pool, which overlaps the
+        open/read latency of network filesystems where SpikeGLX data
+        commonly lives.
             
         Examples
         --------
@@ -896,8 +1721,11 @@ class CatGt_wrapper:
         >>> runs = CatGt_wrapper.build_supercat_from_fyi_files(fyi_files)
         >>> catgt.set_supercat(runs, dest="/data/combined")
         """
-        runs = []
-        for fyi_path in fyi_paths:
-            runs.append(CatGt_wrapper.parse_fyi_supercat_element(fyi_path))
-        return runs 
+        fyi_paths = list(fyi_paths)
+        if len(fyi_paths) <= 1:
+            return [CatGt_wrapper.parse_fyi_supercat_element(p) for p in fyi_paths]
+
+        # ex.map preserves submission order
+        with ThreadPoolExecutor(max_workers=min(32, len(fyi_paths))) as ex:
+            return list(ex.map(CatGt_wrapper.parse_fyi_supercat_element, fyi_paths))
 
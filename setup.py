@@ -33,5 +33,8 @@ setup(
             "pytest>=7.0",
             "pytest-cov>=4.0",
         ],
+        "dask": [
+            "distributed",
+        ],
     },
 )
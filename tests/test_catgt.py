@@ -2,9 +2,20 @@
 Tests for the CatGt wrapper class.
 """
 
+import collections
+import contextlib
+import io
 import unittest
 import os
+import shlex
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
 from purrito import CatGt
+from purrito.catgt import _resolve_executable
 
 
 class TestCatGtBasic(unittest.TestCase):
@@ -220,5 +231,576 @@ class TestCatGtRealWorldUseCases(unittest.TestCase):
         self.assertIn("-dest=/data/processed", cmd)
 
 
+class TestCatGtBasepath(unittest.TestCase):
+    """Test basepath normalization."""
+
+    def test_relative_basepath_made_absolute(self):
+        """Test relative basepaths are resolved against the cwd."""
+        catgt = CatGt(catgt_path="CatGt", basepath="relative/path")
+        self.assertEqual(catgt.basepath, os.path.abspath("relative/path"))
+
+    def test_relative_basepath_resolved_at_assignment(self):
+        """Test a chdir after construction doesn't move a relative basepath."""
+        expected = os.path.abspath("relative/path")
+        catgt = CatGt(catgt_path="CatGt", basepath="relative/path")
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            os.chdir(tmpdir)
+            try:
+                self.assertEqual(catgt.basepath, expected)
+                self.assertIn(f"-dir={expected}", catgt.get_command_args())
+            finally:
+                os.chdir(cwd)
+
+    def test_absolute_basepath_normalized(self):
+        """Test absolute basepaths are normalized like abspath would."""
+        catgt = CatGt(catgt_path="CatGt", basepath="/data/../data/run_g0/")
+        self.assertEqual(catgt.basepath, "/data/run_g0")
+
+    def test_run_name_estimated_from_basepath(self):
+        """Test run_name defaults to the basepath folder name without _g0."""
+        catgt = CatGt(catgt_path="CatGt", basepath="/data/NPX3_CA_TH_g0")
+        self.assertEqual(catgt.run_name, "NPX3_CA_TH")
+        catgt.basepath = "/data/other_g0"
+        self.assertEqual(catgt.run_name, "other")
+        self.assertIn("-run=other", catgt.get_command_args())
+
+
+class TestCatGtCommandCache(unittest.TestCase):
+    """Test that the built command is cached and invalidated on changes."""
+
+    def setUp(self):
+        self.catgt = CatGt(catgt_path="CatGt", basepath="/data/test", run_name="g0")
+
+    def test_repeated_builds_are_equal(self):
+        """Test repeated builds return equal, independent lists."""
+        first = self.catgt.build_command()
+        first.append("-junk")
+        self.assertEqual(self.catgt.build_command(), first[:-1])
+
+    def test_serializations_build_once(self):
+        """Test dry_run, str and get_command_args share one build."""
+        with mock.patch.object(
+            CatGt, "_build_args", autospec=True, side_effect=CatGt._build_args
+        ) as build:
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.catgt.dry_run()
+            str(self.catgt)
+            self.catgt.get_command_args()
+            self.assertEqual(build.call_count, 1)
+            self.catgt.trigger = 1
+            self.catgt.get_command_args()
+            self.assertEqual(build.call_count, 2)
+
+    def test_option_edits_keep_base_fragments(self):
+        """Test option edits reuse the base fragments and base edits rebuild them."""
+        self.catgt.get_command_args()
+        base_args = self.catgt._base_args
+        self.catgt.set_streams(ap=True)
+        self.assertEqual(self.catgt.get_command_args()[:5], base_args)
+        self.assertIs(self.catgt._base_args, base_args)
+        self.catgt.basepath = "/data/other_g0"
+        self.assertEqual(
+            self.catgt.get_command_args()[:3], ["CatGt", "-dir=/data/other_g0", "-run=g0"]
+        )
+
+    def test_setter_invalidates_cache(self):
+        """Test grouped setters are reflected after a cached build."""
+        self.catgt.build_command()
+        self.catgt.set_streams(ap=True)
+        self.assertIn("-ap", self.catgt.build_command())
+
+    def test_direct_option_mutation_invalidates_cache(self):
+        """Test direct edits to the options dict are reflected."""
+        self.catgt.build_command()
+        self.catgt.options["gfix"] = "0.4,0.1,0.02"
+        self.assertIn("-gfix=0.4,0.1,0.02", self.catgt.build_command())
+        del self.catgt.options["gfix"]
+        self.assertNotIn("-gfix=0.4,0.1,0.02", self.catgt.build_command())
+
+    def test_command_args_cache_invalidation(self):
+        """Test get_command_args reflects set_option, remove_option and clear_options."""
+        self.catgt.get_command_args()
+        self.catgt.set_option("t_miss_ok", True)
+        self.assertIn("-t_miss_ok", self.catgt.get_command_args())
+        self.catgt.remove_option("t_miss_ok")
+        self.assertNotIn("-t_miss_ok", self.catgt.get_command_args())
+        self.catgt.set_streams(ap=True)
+        self.catgt.get_command_args()
+        self.catgt.clear_options()
+        self.assertNotIn("-ap", self.catgt.get_command_args())
+
+    def test_options_dict_operations(self):
+        """Test dict-style edits keep command order and content in step."""
+        self.catgt.options.update(ap=True, prb=0)
+        self.catgt.options.setdefault("lf", True)
+        self.catgt.options |= {"dest": "/out"}
+        self.assertEqual(self.catgt.build_command()[-4:], ["-ap", "-prb=0", "-lf", "-dest=/out"])
+        self.catgt.options.pop("prb")
+        self.catgt.options.popitem()
+        self.catgt.options["prb"] = 1
+        self.assertEqual(self.catgt.build_command()[-3:], ["-ap", "-lf", "-prb=1"])
+
+    def test_attribute_assignment_invalidates_cache(self):
+        """Test assigning base fields is reflected."""
+        self.catgt.build_command()
+        self.catgt.gate = 3
+        self.assertIn("-g=3", self.catgt.build_command())
+
+    def test_extraction_invalidates_cache(self):
+        """Test set_extraction is reflected after a cached build."""
+        self.catgt.build_command()
+        self.catgt.set_extraction(xd="0,0,8,1,0")
+        self.assertIn("-xd=0,0,8,1,0", self.catgt.build_command())
+
+    def test_direct_extraction_edits_invalidate_cache(self):
+        """Test direct edits of the extraction dict are reflected."""
+        self.catgt.set_extraction(xd="0,0,8,1,0")
+        self.catgt.build_command()
+        self.catgt.extraction['xa'] = ["0,0,1,2.5,1"]
+        self.assertIn("-xa=0,0,1,2.5,1", self.catgt.build_command())
+        self.catgt.extraction['xd'] += ("0,0,8,2,0",)
+        self.assertIn("-xd=0,0,8,2,0", self.catgt.build_command())
+        del self.catgt.extraction['xa']
+        self.assertNotIn("-xa=0,0,1,2.5,1", self.catgt.build_command())
+        # Stored patterns can't be edited behind the cache's back
+        with self.assertRaises(AttributeError):
+            self.catgt.extraction['xd'].append("0,0,8,3,0")
+
+
+class TestCatGtOptionFormatting(unittest.TestCase):
+    """Test formatting of option values by type."""
+
+    def build(self, **options):
+        return CatGt(catgt_path="CatGt", basepath="/data/test", **options).build_command()
+
+    def test_flags(self):
+        """Test True flags appear bare and False flags are dropped."""
+        cmd = self.build(ap=True, lf=False)
+        self.assertIn("-ap", cmd)
+        self.assertNotIn("-lf", cmd)
+
+    def test_known_flags_ignore_value_type(self):
+        """Test value-less CatGt options format as flags for truthy non-bools."""
+        cmd = self.build(ob=1, t_miss_ok=0)
+        self.assertIn("-ob", cmd)
+        self.assertNotIn("-ob=1", cmd)
+        self.assertNotIn("-t_miss_ok", cmd)
+
+    def test_scalars(self):
+        """Test scalar values are formatted as key=value."""
+        cmd = self.build(prb=0, gfix="0.4,0.1,0.02", loccar_um=40.5)
+        self.assertIn("-prb=0", cmd)
+        self.assertIn("-gfix=0.4,0.1,0.02", cmd)
+        self.assertIn("-loccar_um=40.5", cmd)
+
+    def test_none_is_unset(self):
+        """Test None values written directly to options are skipped."""
+        catgt = CatGt(catgt_path="CatGt", basepath="/data/test")
+        catgt.options["dest"] = None
+        self.assertFalse(any(arg.startswith("-dest") for arg in catgt.build_command()))
+
+    def test_sequences(self):
+        """Test string, numeric and mixed sequences are comma-separated."""
+        cmd = self.build(a=["x", "y"], b=[0, 1, 2], c=(1.5, "z"))
+        self.assertIn("-a=x,y", cmd)
+        self.assertIn("-b=0,1,2", cmd)
+        self.assertIn("-c=1.5,z", cmd)
+
+    def test_sequence_snapshot(self):
+        """Test later edits of a passed-in list don't desync value and command."""
+        chans = [0, 1]
+        catgt = CatGt(catgt_path="CatGt", basepath="/data/test").set_options({"chans": chans})
+        catgt.build_command()
+        chans.append(2)
+        self.assertEqual(catgt.options["chans"], (0, 1))
+        self.assertEqual(catgt.to_dict()["options"]["chans"], (0, 1))
+        self.assertIn("-chans=0,1", catgt.build_command())
+        with self.assertRaises(AttributeError):
+            catgt.options["chans"].append(2)
+
+    def test_sequence_subclass(self):
+        """Test sequence subclasses fall back to comma-separated values."""
+        Span = collections.namedtuple("Span", "start stop")
+        self.assertIn("-t_cat=0,100", self.build(t_cat=Span(0, 100)))
+
+
+class TestCatGtSupercat(unittest.TestCase):
+    """Test supercat option building."""
+
+    def setUp(self):
+        self.catgt = CatGt(catgt_path="CatGt", basepath="/data", run_name="combined")
+
+    def test_supercat_string(self):
+        """Test runs are concatenated as {dir,run_ga} elements."""
+        runs = [
+            {"dir": "/data/output", "run_ga": "catgt_exp1_g0"},
+            {"dir": "/data/output", "run_ga": "catgt_exp2_g0"},
+        ]
+        self.catgt.set_supercat(runs, trim_edges=True, dest="/data/final")
+        cmd = self.catgt.build_command()
+        self.assertIn(
+            "-supercat={/data/output,catgt_exp1_g0}{/data/output,catgt_exp2_g0}", cmd
+        )
+        self.assertIn("-supercat_trim_edges", cmd)
+        self.assertIn("-dest=/data/final", cmd)
+
+    def test_invalid_runs(self):
+        """Test malformed run entries are rejected."""
+        with self.assertRaises(ValueError):
+            self.catgt.set_supercat([{"dir": "/data/output"}], dest="/data/final")
+        with self.assertRaises(ValueError):
+            self.catgt.set_supercat(["/data/output"], dest="/data/final")
+        with self.assertRaises(ValueError):
+            self.catgt.set_supercat([{"dir": "/d", "run_ga": "r_g0"}])
+
+
+class TestCatGtPathsWithSpaces(unittest.TestCase):
+    """Test handling of paths containing spaces."""
+
+    def test_command_args_keep_path_intact(self):
+        """Test a basepath with spaces stays a single argument."""
+        catgt = CatGt(catgt_path="CatGt", basepath="/data/my run_g0", run_name="my run")
+        self.assertIn("-dir=/data/my run_g0", catgt.get_command_args())
+
+    def test_str_is_plain_join(self):
+        """Test the printable command joins arguments without quoting."""
+        catgt = CatGt(catgt_path="CatGt", basepath="/data/my run_g0", run_name="my run")
+        self.assertEqual(str(catgt), " ".join(catgt.build_command()))
+
+    def test_slurm_command_is_shell_quoted(self):
+        """Test sbatch scripts get a command a POSIX shell splits correctly."""
+        catgt = CatGt(catgt_path="CatGt", basepath="/data/my run_g0", run_name="my run")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = CatGt.run_batch_slurm([catgt], "$command", tmpdir)
+            with open(paths[0]) as f:
+                script = f.read()
+        self.assertEqual(shlex.split(script), catgt.build_command())
+
+
+class TestCatGtFyiParsing(unittest.TestCase):
+    """Test parsing supercat elements from FYI files."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def write_fyi(self, name, content):
+        path = os.path.join(self.tmpdir.name, name)
+        with open(path, "w") as f:
+            f.write(content)
+        return path
+
+    def test_parse_supercat_element(self):
+        """Test the supercat_element line is found among other lines."""
+        path = self.write_fyi(
+            "run1_g0_fyi.txt",
+            "outpath_top=/data/out\n"
+            "supercat_element={/data/out,catgt_run1_g0}\n"
+            "trigger=0\n",
+        )
+        element = CatGt.parse_fyi_supercat_element(path)
+        self.assertEqual(element, {"dir": "/data/out", "run_ga": "catgt_run1_g0"})
+
+    def test_missing_supercat_element(self):
+        """Test a ValueError is raised when no element is present."""
+        path = self.write_fyi("run1_g0_fyi.txt", "outpath_top=/data/out\n")
+        with self.assertRaises(ValueError):
+            CatGt.parse_fyi_supercat_element(path)
+
+    def test_build_supercat_preserves_order(self):
+        """Test runs are returned in the order of the FYI paths."""
+        paths = [
+            self.write_fyi(
+                f"run{i}_g0_fyi.txt",
+                f"supercat_element={{/data/out,catgt_run{i}_g0}}\n",
+            )
+            for i in range(8)
+        ]
+        runs = CatGt.build_supercat_from_fyi_files(paths)
+        self.assertEqual([r["run_ga"] for r in runs], [f"catgt_run{i}_g0" for i in range(8)])
+        self.assertEqual(CatGt.build_supercat_from_fyi_files([]), [])
+
+    def test_missing_file(self):
+        """Test a FileNotFoundError is raised for a missing FYI file."""
+        with self.assertRaises(FileNotFoundError):
+            CatGt.parse_fyi_supercat_element(os.path.join(self.tmpdir.name, "nope.txt"))
+
+
+class TestCatGtSerialization(unittest.TestCase):
+    """Test exporting and rebuilding configurations."""
+
+    def test_dict_round_trip(self):
+        """Test from_dict(to_dict()) rebuilds the same command."""
+        catgt = CatGt(catgt_path="CatGt", basepath="/data/run_g0", gate=1)
+        catgt.set_streams(ap=True).set_filters(apfilter="butter,12,300,9000")
+        catgt.set_extraction(xd=["0,0,8,1,0", "0,0,8,2,0"])
+        rebuilt = CatGt.from_dict(catgt.to_dict())
+        self.assertEqual(rebuilt.get_command_args(), catgt.get_command_args())
+
+    def test_run_batch_slurm_writes_scripts(self):
+        """Test one script is written per config with the command substituted."""
+        configs = [
+            CatGt(catgt_path="CatGt", basepath=f"/data/run{i}_g0").to_dict()
+            for i in range(2)
+        ]
+        template = "#!/bin/bash\n#SBATCH --job-name=catgt_$run_name\necho $$SLURM_JOB_ID\n$command\n"
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = CatGt.run_batch_slurm(configs, template, tmpdir)
+            self.assertEqual(len(paths), 2)
+            with open(paths[1]) as f:
+                script = f.read()
+        self.assertIn("--job-name=catgt_run1", script)
+        self.assertIn("echo $SLURM_JOB_ID", script)
+        self.assertIn("CatGt -dir=/data/run1_g0 -run=run1", script)
+
+    def test_argv_fingerprint(self):
+        """Test fingerprints match for equal commands and differ otherwise."""
+        first = CatGt(catgt_path="CatGt", basepath="/data/run_g0", ap=True)
+        second = CatGt.from_dict(first.to_dict())
+        self.assertEqual(first.argv_fingerprint(), second.argv_fingerprint())
+        second.set_streams(lf=True)
+        self.assertNotEqual(first.argv_fingerprint(), second.argv_fingerprint())
+
+    def test_run_batch_unknown_backend(self):
+        """Test an unknown backend is rejected."""
+        with self.assertRaises(ValueError):
+            CatGt.run_batch([], backend="threads")
+
+
+ECHO = shutil.which("echo")
+FALSE = shutil.which("false")
+
+
+def write_script(folder, name="CatGt", body=""):
+    """Write an executable shell script standing in for CatGt."""
+    path = os.path.join(folder, name)
+    with open(path, "w") as f:
+        f.write(f"#!/bin/sh\n{body}\n")
+    os.chmod(path, 0o755)
+    return path
+
+
+@unittest.skipUnless(ECHO and FALSE, "needs echo and false executables")
+class TestCatGtExecution(unittest.TestCase):
+    """Test executing commands, using echo/false as stand-ins for CatGt."""
+
+    def make(self, catgt_path=ECHO, **options):
+        return CatGt(catgt_path=catgt_path, basepath="/data/test", run_name="g0", **options)
+
+    def test_run_streams_to_files(self):
+        """Test run writes stdout to a file instead of capturing it."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            out_path = os.path.join(tmpdir, "catgt.log")
+            result = self.make(ap=True).run(stdout_path=out_path)
+            self.assertIsNone(result.stdout)
+            self.assertEqual(result.stderr, b"")
+            with open(out_path) as f:
+                self.assertIn("-ap", f.read())
+
+    def test_run_log_dir(self):
+        """Test log_dir streams both outputs to per-run files."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_dir = os.path.join(tmpdir, "logs")
+            catgt = self.make(prb=1)
+            result = catgt.run(log_dir=log_dir)
+            self.assertIsNone(result.stdout)
+            expected = f"g0_g0_t0_imec1_{catgt.argv_fingerprint()[:8]}_catgt.out"
+            self.assertEqual(result.stdout_path, os.path.join(log_dir, expected))
+            self.assertTrue(os.path.exists(result.stderr_path))
+            with open(result.stdout_path) as f:
+                self.assertIn("-prb=1", f.read())
+
+    def test_run_log_dir_shared_run_name(self):
+        """Test jobs sharing a run name still get their own log files."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            first = self.make(prb=0, ap=True).run(log_dir=tmpdir)
+            second = self.make(prb=0, lf=True).run(log_dir=tmpdir)
+            self.assertNotEqual(first.stdout_path, second.stdout_path)
+            with open(first.stdout_path) as f:
+                self.assertIn("-ap", f.read())
+            with open(second.stdout_path) as f:
+                self.assertIn("-lf", f.read())
+
+    def test_run_combined_log(self):
+        """Test one file for stdout and stderr keeps both streams."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            script = write_script(tmpdir, body="echo OUT-LINE-LONG-LONG\necho ERR >&2")
+            log_path = os.path.join(tmpdir, "catgt.log")
+            self.make(catgt_path=script).run(stdout_path=log_path, stderr_path=log_path)
+            with open(log_path) as f:
+                self.assertEqual(f.read(), "OUT-LINE-LONG-LONG\nERR\n")
+
+    def test_failed_run_reports_log_paths(self):
+        """Test a failure with log_dir says where its logs were written."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with self.assertRaises(subprocess.CalledProcessError) as ctx:
+                self.make(catgt_path=FALSE).run(log_dir=tmpdir)
+            self.assertTrue(os.path.exists(ctx.exception.stderr_path))
+            self.assertEqual(os.path.dirname(ctx.exception.stdout_path), tmpdir)
+            with self.assertRaises(subprocess.CalledProcessError) as ctx:
+                CatGt.run_batch([self.make(catgt_path=FALSE)], n_workers=1, log_dir=tmpdir)
+            self.assertTrue(os.path.exists(ctx.exception.stderr_path))
+
+    def test_log_stem_sanitizes_probe(self):
+        """Test probe lists and ranges give portable file names."""
+        self.assertIn("_imec0,1_", self.make(prb=[0, 1])._log_stem())
+        self.assertIn("_imec0,3-5_", self.make(prb="0,3:5")._log_stem())
+
+    def test_log_stem_without_gate_or_trigger(self):
+        """Test unset gate and trigger are left out of log names."""
+        catgt = self.make()
+        catgt.gate = None
+        catgt.trigger = None
+        self.assertNotIn("None", catgt._log_stem())
+        self.assertTrue(catgt._log_stem().startswith("g0_"))
+
+    def test_run_fast_spawn(self):
+        """Test fast_spawn launches the same command."""
+        result = self.make(ap=True).run(fast_spawn=True)
+        self.assertIn("-ap", result.stdout.decode())
+        process = self.make(ap=True).run_async(fast_spawn=True, stdout=subprocess.PIPE)
+        stdout, _ = process.communicate()
+        self.assertIn("-ap", stdout.decode())
+
+    def test_run_batch_process_backend(self):
+        """Test run_batch runs every config in worker processes, in order."""
+        configs = [self.make(prb=i).to_dict() for i in range(3)]
+        results = CatGt.run_batch(configs, n_workers=2)
+        for i, result in enumerate(results):
+            self.assertIn(f"-prb={i}", result.stdout.decode())
+
+    def test_run_pipeline_yields_every_result(self):
+        """Test run_pipeline yields one result per config."""
+        configs = [self.make(prb=i) for i in range(4)] + [self.make(catgt_path=FALSE).to_dict()]
+        results = list(CatGt.run_pipeline(configs, max_concurrent=2, check=False))
+        self.assertEqual(len(results), 5)
+        self.assertEqual(sorted(r.returncode for r in results), [0, 0, 0, 0, 1])
+        self.assertEqual(list(CatGt.run_pipeline([])), [])
+
+    def test_validate_resolves_executable(self):
+        """Test validate=True stores the absolute executable path."""
+        catgt = CatGt(catgt_path="echo", basepath="/data/test", validate=True)
+        self.assertTrue(os.path.isabs(catgt.catgt_path))
+        with self.assertRaises(FileNotFoundError):
+            CatGt(catgt_path="/nonexistent/CatGt", basepath="/data/test", validate=True)
+
+    def test_batch_fails_fast_on_missing_executable(self):
+        """Test batch drivers check executables before starting any job."""
+        wrappers = [self.make(), self.make(catgt_path="/nonexistent/CatGt")]
+        with mock.patch.object(CatGt, "run") as run:
+            with self.assertRaises(FileNotFoundError):
+                list(CatGt.run_pipeline(wrappers))
+            run.assert_not_called()
+        with self.assertRaises(FileNotFoundError):
+            CatGt.run_many(wrappers)
+        with self.assertRaises(FileNotFoundError):
+            CatGt.run_batch(wrappers)
+
+    def test_run_batch_dask_client_skips_local_check(self):
+        """Test a given dask client gets the jobs without a local path check."""
+        class Client:
+            def map(self, func, configs, pure=True):
+                return [config["catgt_path"] for config in configs]
+
+            def gather(self, futures):
+                return futures
+
+        configs = [self.make(catgt_path="/cluster/bin/CatGt", prb=i) for i in range(2)]
+        results = CatGt.run_batch(configs, backend="dask", client=Client())
+        self.assertEqual(results, ["/cluster/bin/CatGt"] * 2)
+
+    def test_relative_executable_resolved_per_cwd(self):
+        """Test ./CatGt style paths are resolved against the current cwd."""
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as first, tempfile.TemporaryDirectory() as second:
+            for folder in (first, second):
+                write_script(folder)
+            try:
+                os.chdir(first)
+                self.assertEqual(_resolve_executable("./CatGt"), os.path.join(os.getcwd(), "CatGt"))
+                os.chdir(second)
+                self.assertEqual(_resolve_executable("./CatGt"), os.path.join(os.getcwd(), "CatGt"))
+            finally:
+                os.chdir(cwd)
+
+    def test_batch_check_uses_forwarded_env_and_cwd(self):
+        """Test the up-front check looks where the jobs will, via env and cwd."""
+        with tempfile.TemporaryDirectory() as bindir, tempfile.TemporaryDirectory() as workdir:
+            write_script(bindir, "MyCat")
+            env = dict(os.environ, PATH=bindir)
+            catgt = self.make(catgt_path="MyCat")
+            self.assertEqual(CatGt.run_batch([catgt], n_workers=1, env=env)[0].returncode, 0)
+            self.assertEqual(len(list(CatGt.run_pipeline([catgt], env=env))), 1)
+            with self.assertRaises(FileNotFoundError):
+                CatGt.run_batch([catgt], n_workers=1)
+
+            write_script(workdir)
+            relative = self.make(catgt_path="./CatGt")
+            self.assertEqual(len(list(CatGt.run_pipeline([relative], cwd=workdir))), 1)
+
+    def test_executable_lookup_follows_path(self):
+        """Test cached lookups aren't reused under a different PATH."""
+        with tempfile.TemporaryDirectory() as first, tempfile.TemporaryDirectory() as second:
+            write_script(first, "MyCat")
+            write_script(second, "MyCat")
+            self.assertEqual(
+                _resolve_executable("MyCat", {"PATH": first}), os.path.join(first, "MyCat")
+            )
+            self.assertEqual(
+                _resolve_executable("MyCat", {"PATH": second}), os.path.join(second, "MyCat")
+            )
+
+    def test_fast_spawn_runs_same_program(self):
+        """Test fast_spawn never picks a different program than a plain run."""
+        with tempfile.TemporaryDirectory() as first, tempfile.TemporaryDirectory() as second:
+            write_script(first, "MyCat", "echo from-a")
+            write_script(second, "MyCat", "echo from-b")
+            catgt = self.make(catgt_path="MyCat")
+            env = dict(os.environ, PATH=second)
+            with mock.patch.dict(os.environ, PATH=first):
+                self.assertEqual(catgt.run(fast_spawn=True).stdout, b"from-a\n")
+                self.assertEqual(catgt.run(env=env, fast_spawn=True).stdout, b"from-b\n")
+            with mock.patch.dict(os.environ, PATH=second):
+                self.assertEqual(catgt.run(fast_spawn=True).stdout, b"from-b\n")
+
+    def test_fast_spawn_uses_resolved_executable(self):
+        """Test fast_spawn passes close_fds=False and an absolute executable."""
+        catgt = self.make(catgt_path="echo")
+        with mock.patch("subprocess.Popen") as popen:
+            catgt.run_async(fast_spawn=True)
+        args, kwargs = popen.call_args
+        self.assertEqual(args[0][0], "echo")
+        self.assertFalse(kwargs["close_fds"])
+        self.assertTrue(os.path.isabs(kwargs["executable"]))
+
+    def test_run_batch_skips_duplicate_commands(self):
+        """Test identical commands in a batch run once and share a result."""
+        configs = [self.make(prb=0), self.make(prb=1).to_dict(), self.make(prb=0).to_dict()]
+        with mock.patch("purrito.catgt.ProcessPoolExecutor", ThreadPoolExecutor), \
+                mock.patch.object(CatGt, "run", autospec=True, side_effect=CatGt.run) as run:
+            results = CatGt.run_batch(configs, n_workers=2)
+        self.assertEqual(run.call_count, 2)
+        self.assertIs(results[0], results[2])
+        self.assertIn("-prb=1", results[1].stdout.decode())
+
+    def test_run_many_preserves_order(self):
+        """Test run_many returns one result per wrapper, in order."""
+        wrappers = [self.make(prb=i) for i in range(5)]
+        results = CatGt.run_many(wrappers, max_parallel=2, fast_spawn=True)
+        self.assertEqual(len(results), 5)
+        for i, result in enumerate(results):
+            self.assertEqual(result.returncode, 0)
+            self.assertIn(f"-prb={i}", result.stdout.decode())
+
+    def test_run_many_check(self):
+        """Test run_many raises for a failed job only when check=True."""
+        wrappers = [self.make(), self.make(catgt_path=FALSE)]
+        with self.assertRaises(subprocess.CalledProcessError):
+            CatGt.run_many(wrappers)
+        results = CatGt.run_many(wrappers, check=False)
+        self.assertEqual([r.returncode for r in results], [0, 1])
+
+
 if __name__ == "__main__":
     unittest.main()